@@ -7,6 +7,11 @@ from .data_index import get_data_index  # noqa
 from .path_finder import PathFinder  # noqa
 from .readers import *  # noqa
 from .cmlreader import CMLReader  # noqa
+from . import cmlreader as _cmlreader
+
+# cmlreader is first imported by the reader modules themselves, so the
+# registry can only be filled once the readers package is complete
+_cmlreader._init_registry()
 
 __version__ = "0.9.8"
 version_info = namedtuple("VersionInfo", "major,minor,patch")(
@@ -0,0 +1,31 @@
+"""Numba kernels used by the EEG readers. This module imports numba, so it
+is only imported on first use of a kernel (see
+:func:`cmlreaders.readers.eeg._numba_kernels`).
+
+"""
+import numba
+
+
+@numba.njit(nogil=True, cache=True)
+def copy_epochs(buf, starts, out):
+    """Copy the epochs of a single channel starting at ``starts`` from
+    ``buf`` into ``out``, shaped as (epochs, time).
+
+    """
+    for e in range(starts.shape[0]):
+        start = starts[e]
+        for t in range(out.shape[1]):
+            out[e, t] = buf[start + t]
+
+
+@numba.njit(parallel=True, cache=True)
+def bipolar_diff(data, c1, c2, out):
+    """Compute bipolar channels ``data[:, c1] - data[:, c2]`` in a single
+    pass over the data, writing into ``out``.
+
+    """
+    for e in numba.prange(data.shape[0]):
+        for p in range(c1.shape[0]):
+            i, j = c1[p], c2[p]
+            for t in range(data.shape[2]):
+                out[e, p, t] = data[e, i, t] - data[e, j, t]
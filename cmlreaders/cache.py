@@ -29,4 +29,8 @@ def disable(clear: bool = False):
 def clear_all():
     """Clear all cached results."""
     from cmlreaders.base_reader import BaseCMLReader
+    from cmlreaders.cmlreader import _cached_index
+    from cmlreaders.readers.electrodes import _read_montage_records
     BaseCMLReader.clear_all_caches()
+    _cached_index.cache_clear()
+    _read_montage_records.cache_clear()
@@ -1,10 +1,14 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import functools
+import itertools
 from typing import List, Optional, Union
 
 import numpy as np
 import pandas as pd
 
 from . import readers
+from .constants import PROTOCOLS, TASK_EVENTS_ONLY_EXPERIMENT_PREFIXES
 from .data_index import get_data_index
 from .exc import IncompatibleParametersError, UnsupportedProtocolError
 from .util import get_protocol, get_root_dir
@@ -12,6 +16,51 @@ from .util import get_protocol, get_root_dir
 
 __all__ = ['CMLReader']
 
+# number of sessions' events to combine at a time in load_events
+_EVENTS_BATCH_SIZE = 16
+
+
+@functools.lru_cache(maxsize=len(PROTOCOLS))
+def _cached_index(protocol: str, rootdir: str) -> pd.DataFrame:
+    """Load and clean the data index for a given protocol. Results are cached
+    so that repeated lookups of localization and montage numbers don't need to
+    re-read and re-clean the index.
+
+    Notes
+    -----
+    The returned :class:`pd.DataFrame` is shared between callers and must not
+    be modified in place.
+
+    """
+    index = get_data_index(protocol, rootdir=rootdir)
+
+    # Some subjects don't explicitly specify localization/montage numbers in
+    # the index, so they appear as NaNs. Protocols that don't include
+    # localization data (e.g., ltp) simply won't have these columns.
+    index = index.fillna({"montage": "0", "localization": "0"})
+
+    # Sorting once here means sessions come out in a consistent order for
+    # every consumer of the index (e.g., load_events)
+    index = index.sort_values(["subject", "experiment", "session"])
+    index = index.reset_index(drop=True)
+
+    # Categorical columns make filtering by subject/experiment much cheaper
+    for column in ["subject", "experiment", "protocol"]:
+        if column in index:
+            index[column] = index[column].astype("category")
+
+    return index
+
+
+def _concat_events(events: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate events, aligning columns up front rather than letting
+    :func:`pd.concat` sort the union of columns itself.
+
+    """
+    columns = sorted(set().union(*(e.columns for e in events)))
+    events = [e.reindex(columns=columns, copy=False) for e in events]
+    return pd.concat(events, sort=False, copy=False)
+
 
 class CMLReader(object):
     """ Generic reader for all CML-specific files
@@ -23,14 +72,17 @@ class CMLReader(object):
     reader_names dictionary. reader_names is a dict whose keys are one of
     the data types understood by :class:`cmlreaders.PathFinder` and defined in
     :mod:`cmlreaders.constants`. Values are the name of the reader class
-    that should be used for loading/reading the data type. When an instance of
-    :class:`cmlreaders.cmlreader.CMLReader` is instantiated, a new dictionary
-    is created that maps the data types to the actual reader class, rather than
+    that should be used for loading/reading the data type. Once all modules
+    in :mod:`cmlreaders.readers` have been imported, a new dictionary is
+    created that maps the data types to the actual reader class, rather than
     just the class name. In essence, :class:`cmlreaders.cmlreader.CMLReader` is
     a factory that routes the requests for loading a particular data type to
     the reader defined to handle that data.
 
     """
+    __slots__ = ("subject", "experiment", "session", "rootdir", "protocol",
+                 "_localization", "_montage", "_path_finder")
+
     reader_names = {}
     readers = {}
     reader_protocols = {}
@@ -49,19 +101,10 @@ class CMLReader(object):
 
         self._localization = localization
         self._montage = montage
+        self._path_finder = None
 
         self.protocol = get_protocol(self.subject)
 
-        if not len(CMLReader.readers):
-            CMLReader.readers = {
-                k: getattr(readers, v) for k, v in self.reader_names.items()
-            }
-        if not len(CMLReader.reader_protocols):
-            CMLReader.reader_protocols = {
-                k: getattr(readers, v).protocols
-                for k, v in self.reader_names.items()
-            }
-
     def __repr__(self):
         return "CMLReader(subject={}, experiment={}, session={})".format(
             self.subject, self.experiment, self.session
@@ -72,19 +115,7 @@ class CMLReader(object):
         localization nubmers.
 
         """
-        index = get_data_index(self.protocol, rootdir=self.rootdir)
-
-        # Some subjects don't explicitly specify localization/montage
-        # numbers in the index, so they appear as NaNs.
-        try:
-            index["montage"].replace({np.nan: "0"}, inplace=True)
-            index["localization"].replace({np.nan: "0"}, inplace=True)
-        except KeyError:
-            # We're using a protocol that doesn't include localization data
-            # (e.g., ltp)
-            pass
-
-        return index
+        return _cached_index(self.protocol, self.rootdir)
 
     def _determine_localization_or_montage(self, which: str) -> Optional[int]:
         """Inner workings of localization/montage properties.
@@ -98,23 +129,28 @@ class CMLReader(object):
             raise ValueError
 
         index = self._load_index()
-        df = index[index["subject"] == self.subject]
 
-        if which not in df:
+        # Check before filtering since some protocols (e.g., ltp) don't
+        # include localization or montage numbers at all
+        if which not in index:
             setattr(self, "_" + which, None)
             return None
 
+        df = index[index["subject"] == self.subject]
+
         if self.experiment is not None:
             df = df[df.experiment == self.experiment]
 
         if self.session is not None:
             df = df[df.session == self.session]
 
-        if len(df[which].unique()) != 1:
+        values = pd.unique(df[which].values)
+
+        if len(values) != 1:
             setattr(self, "_" + which, None)
             return None
         else:
-            value = int(df[which].unique()[0])
+            value = int(values[0])
             setattr(self, "_" + which, value)
             return value
 
@@ -143,10 +179,16 @@ class CMLReader(object):
 
     @property
     def path_finder(self):
-        """Return a path finder using the proper kwargs."""
-        from .path_finder import PathFinder
-        return PathFinder(self.subject, self.experiment, self.session,
-                          self.localization, self.montage, self.rootdir)
+        """Return a path finder using the proper kwargs. The path finder is
+        only constructed on first access.
+
+        """
+        if self._path_finder is None:
+            from .path_finder import PathFinder
+            self._path_finder = PathFinder(self.subject, self.experiment,
+                                           self.session, self.localization,
+                                           self.montage, self.rootdir)
+        return self._path_finder
 
     @functools.lru_cache()
     def _construct_reader(self, data_type, subject, experiment, session,
@@ -197,11 +239,8 @@ class CMLReader(object):
         # coerce to "all_events" unless we're looking at experiments that don't
         # include these.
         if data_type == "events":
-            if (
-                self.experiment.startswith("PS") or
-                self.experiment.startswith("TH") or
-                self.experiment.startswith("YC") or
-                self.experiment.startswith("Location")
+            if self.experiment.startswith(
+                TASK_EVENTS_ONLY_EXPERIMENT_PREFIXES
             ):
                 data_type = "task_events"
             else:
@@ -264,15 +303,6 @@ class CMLReader(object):
             used without passing ``rel_start`` and/or ``rel_stop``.
 
         """
-        kwargs = {
-            "scheme": scheme,
-            "clean": clean
-        }
-        if rel_start is not None:
-            kwargs["rel_start"] = rel_start
-        if rel_stop is not None:
-            kwargs["rel_stop"] = rel_stop
-
         if events is not None:
             # Unless prevented here, cmlreader will take any events
             # regardless of which subject and session it was
@@ -282,37 +312,39 @@ class CMLReader(object):
             # are limiting the load_eeg method to only apply to events
             # for the subject and session with which the cmlreader
             # object was initialized with:
-            if 'subject' in events:
-                if len(np.unique(events['subject'])) != 1:
-                    raise ValueError(
-                        'Events must correspond to one subject only')
-                if events['subject'][0] != self.subject:
-                    raise ValueError(
-                        'Events must correspond to the subject with which ' +
-                        'the reader was initialized: ' +
-                        self.subject + ' (events correspond to ' +
-                        events['subject'][0] + ')')
-            if 'session' in events:
-                if len(np.unique(events['session'])) != 1:
+            for column, expected in [("subject", self.subject),
+                                     ("session", self.session)]:
+                if column not in events:
+                    continue
+
+                # pd.unique works directly on the codes of categorical columns
+                values = pd.unique(events[column].values)
+
+                if len(values) != 1:
                     raise ValueError(
-                        'Events must correspond to one session only')
-                if events['session'][0] != self.session:
+                        'Events must correspond to one {} only'.format(column))
+                if values[0] != expected:
                     raise ValueError(
-                        'Events must correspond to the session with which ' +
-                        'the reader was initialized: ' +
-                        self.session + ' (events correspond to ' +
-                        events['session'][0] + ')')
-                
-            if "rel_start" not in kwargs or "rel_stop" not in kwargs:
+                        'Events must correspond to the {} with which the '
+                        'reader was initialized: {} (events correspond to '
+                        '{})'.format(column, expected, values[0]))
+
+            if rel_start is None or rel_stop is None:
                 raise IncompatibleParametersError(
                     "rel_start and rel_stop are required keyword arguments"
                     " when passing events")
-            kwargs.update({
-                'events': events,
-                'rel_start': rel_start,
-                'rel_stop': rel_stop
-            })
 
+        # scheme and clean are always passed along, everything else only when
+        # given
+        kwargs = {
+            key: value for key, value in (
+                ("scheme", scheme),
+                ("clean", clean),
+                ("events", events),
+                ("rel_start", rel_start),
+                ("rel_stop", rel_stop),
+            ) if value is not None or key in ("scheme", "clean")
+        }
         return self.load('eeg', **kwargs)
 
     @classmethod
@@ -337,7 +369,7 @@ class CMLReader(object):
             )
 
         rootdir = get_root_dir(rootdir)
-        df = get_data_index("all", rootdir=rootdir)
+        df = _cached_index("all", rootdir)
 
         if isinstance(subjects, str):
             subjects = [subjects]
@@ -349,17 +381,77 @@ class CMLReader(object):
         elif experiments is None:
             experiments = df["experiment"].unique()
 
-        events = []
-
-        for subject in subjects:
-            for experiment in experiments:
-                mask = (df["subject"] == subject) &\
-                       (df["experiment"] == experiment)
-                sessions = df[mask]["session"].unique()
-
-                for session in sessions:
-                    reader = CMLReader(subject, experiment, session,
-                                       rootdir=rootdir)
-                    events.append(reader.load("events"))
+        mask = (df["subject"].isin(subjects) &
+                df["experiment"].isin(experiments))
+        keys = ["subject", "experiment", "session"]
+        sessions = df.loc[mask, keys + ["localization", "montage"]]
+
+        # return sessions grouped in the order subjects and experiments were
+        # given, with sessions in index order within each group
+        def rank(values, column):
+            order = pd.Index(list(dict.fromkeys(values)))
+            return order.get_indexer(sessions[column].astype(object))
+
+        subject_rank = rank(subjects, "subject")
+        experiment_rank = rank(experiments, "experiment")
+        order = np.lexsort((np.arange(len(sessions)), experiment_rank,
+                            subject_rank))
+        sessions = sessions.iloc[order]
+        first = ~sessions.duplicated(keys).values
+        unique = ~sessions.duplicated(keys, keep=False).values
+
+        def make_reader(row, is_unique):
+            # We already know localization and montage numbers from the index
+            # so there is no need for each reader to look them up again. These
+            # aren't used by ltp, so leave it to the reader to determine them.
+            if is_unique and get_protocol(row.subject) != "ltp":
+                localization, montage = int(row.localization), int(row.montage)
+            else:
+                localization = montage = None
+            return CMLReader(row.subject, row.experiment, row.session,
+                             localization=localization, montage=montage,
+                             rootdir=rootdir)
+
+        # Loading events is I/O bound, so load sessions concurrently. Only a
+        # limited number of sessions are submitted at a time so that finished
+        # results waiting to be combined don't pile up in memory; results are
+        # combined in batches as they come in.
+        rows = zip(sessions[first].itertuples(index=False), unique[first])
+        max_workers = min(32, first.sum() or 1)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            def submit(n):
+                for row, is_unique in itertools.islice(rows, n):
+                    futures.append(pool.submit(
+                        make_reader(row, is_unique).load, "events"))
+
+            futures = deque()
+            submit(max_workers + _EVENTS_BATCH_SIZE)
+            chunks, batch = [], []
+
+            while futures:
+                batch.append(futures.popleft().result())
+                submit(1)
+                if len(batch) == _EVENTS_BATCH_SIZE:
+                    chunks.append(_concat_events(batch))
+                    batch = []
+
+        return _concat_events(chunks + batch)
+
+
+def _init_registry():
+    """Populate the mappings of data types to reader classes and supported
+    protocols. This is called once from :mod:`cmlreaders` after all readers
+    in :mod:`cmlreaders.readers` have been imported.
 
-        return pd.concat(events, sort=True)
+    """
+    if CMLReader.readers:
+        return
+
+    CMLReader.readers = {
+        k: getattr(readers, v) for k, v in CMLReader.reader_names.items()
+    }
+    CMLReader.reader_protocols = {
+        k: getattr(readers, v).protocols
+        for k, v in CMLReader.reader_names.items()
+    }
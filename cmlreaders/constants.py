@@ -9,6 +9,9 @@ PROTOCOLS = (
 
 PYFR_SUBJECT_CODE_PREFIXES = ("BW", "CH", "CP", "FR", "FZ", "TJ", "UP")
 
+# experiments which only have task events (i.e., no math events)
+TASK_EVENTS_ONLY_EXPERIMENT_PREFIXES = ("PS", "TH", "YC", "Location")
+
 rhino_paths = {
     # data indices
     "r1_index": ["protocols/r1.json"],
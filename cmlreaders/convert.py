@@ -91,12 +91,16 @@ def events_to_epochs(events: pd.DataFrame, rel_start: int, rel_stop: int,
     rel_start = milliseconds_to_samples(rel_start, sample_rate)
     rel_stop = milliseconds_to_samples(rel_stop, sample_rate)
     offsets = events.eegoffset.values
+    starts = (offsets + rel_start).tolist()
+    stops = (offsets + rel_stop).tolist()
+
     if basenames is not None:
-        eegfiles = events.eegfile.values
-        epochs = [(offset + rel_start, offset + rel_stop,
-                   basenames.index(eegfile))
-                  for (offset, eegfile) in zip(offsets, eegfiles)]
+        # index of the first occurrence of each basename
+        indices = {}
+        for i, basename in enumerate(basenames):
+            indices.setdefault(basename, i)
+        files = [indices[eegfile] for eegfile in events.eegfile.values]
     else:
-        epochs = [(offset + rel_start, offset + rel_stop, 0)
-                  for offset in offsets]
-    return epochs
+        files = [0] * len(offsets)
+
+    return list(zip(starts, stops, files))
@@ -1,5 +1,4 @@
 from functools import lru_cache
-import json
 import os
 from pathlib import Path
 from typing import Dict, Optional
@@ -11,14 +10,14 @@ import scipy.io as sio
 
 from .constants import PROTOCOLS, rhino_paths
 from .path_finder import PathFinder
-from .util import get_root_dir
+from .util import get_root_dir, load_json
 
 
 def read_index(path: str) -> Dict:
     """Reads the data index, removing the initial stages of nesting."""
     path = Path(path)
     kind = os.path.splitext(path.name)[0]
-    data = json.loads(path.read_text())
+    data = load_json(path)
     return data["protocols"][kind]["subjects"]
 
 
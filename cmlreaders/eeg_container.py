@@ -5,6 +5,10 @@ import pandas as pd
 import scipy
 
 
+# dimensions EEGContainer.concatenate can join along
+_CONCAT_DIMS = frozenset(("events", "time"))
+
+
 class EEGContainer(object):
     """A simple wrapper around a ndarray to represent EEG time series data.
 
@@ -37,6 +41,8 @@ class EEGContainer(object):
         Epoch start and stop times.
     time
         Array of time points in milliseconds.
+    tstart
+        Start time for each epoch in ms.
 
     Raises
     ------
@@ -51,14 +57,17 @@ class EEGContainer(object):
                  channels: Optional[List[str]] = None,
                  tstart: Union[int, float] = 0,
                  attrs: Optional[Dict[str, Any]] = None):
-        if len(data.shape) == 2:
-            data = np.array([data])
-        if len(data.shape) != 3:
+        ndim = data.ndim
+        if ndim not in (2, 3):
             raise ValueError("Data must be 2- or 3-dimensional")
+        if ndim == 2:
+            # add the epochs dimension as a view rather than a copy
+            data = data[np.newaxis, ...]
 
         self.data = data
         self.samplerate = samplerate
-        self.time = self._make_time_array(tstart)  # time in milliseconds
+        self._tstart = tstart
+        self._time = None  # type: np.ndarray
         self.events = events
 
         if epochs is not None:
@@ -67,7 +76,8 @@ class EEGContainer(object):
                                  "data dimension")
             self.epochs = epochs
         else:
-            self.epochs = [(-1, -1) for _ in range(self.data.shape[0])]
+            # tuples are immutable, so every epoch can share the default
+            self.epochs = [(-1, -1)] * self.data.shape[0]
 
         if channels is not None:
             if len(channels) != self.data.shape[1]:
@@ -77,16 +87,36 @@ class EEGContainer(object):
                     % (len(channels), self.data.shape[1]))
             self.channels = channels
         else:
-            self.channels = np.linspace(1, self.data.shape[1],
-                                        self.data.shape[1],
-                                        dtype=np.int).tolist()
+            self.channels = list(range(1, self.data.shape[1] + 1))
 
         self.attrs = attrs if attrs is not None else {}
 
+    @property
+    def tstart(self) -> Union[int, float]:
+        """Start time of each epoch in milliseconds."""
+        if self._time is not None:
+            return self._time[0]
+        return self._tstart
+
+    @property
+    def time(self) -> np.ndarray:
+        """Array of time points in milliseconds. This is only computed when
+        first accessed.
+
+        """
+        if self._time is None:
+            self._time = self._make_time_array(self._tstart)
+        return self._time
+
+    @time.setter
+    def time(self, time: np.ndarray):
+        self._time = time
+
     def _make_time_array(self, tstart):
-        rate = 1000. / self.samplerate
+        # an integer ramp is exactly n_samples long, unlike a float arange
+        step = 1000. / self.samplerate
         n_samples = self.data.shape[-1]
-        return np.arange(tstart, n_samples * rate + tstart, rate)
+        return tstart + np.arange(n_samples, dtype=np.int64) * step
 
     @classmethod
     def concatenate(cls, containers: List["EEGContainer"], dim="events") -> \
@@ -113,50 +143,58 @@ class EEGContainer(object):
 
         Notes
         -----
-        This attempts to combine attributes using a :class:`ChainMap`. This is
+        Attributes are combined by mapping each key of the first container's
+        attributes to a list of the values from every container. This is
         likely not the right solution, so don't rely on keeping attributes.
 
         """
-        if dim not in ["events", "time"]:
+        if dim not in _CONCAT_DIMS:
             raise ValueError("Invalid dimension to concatenate on: " + dim)
 
         samplerate = containers[0].samplerate
-        if not all([s.samplerate == samplerate for s in containers]):
+        if not all(s.samplerate == samplerate for s in containers[1:]):
             raise ValueError("Sample rates must be the same for all series")
 
         def check_samples():
-            if not all([s.shape[-1] == containers[0].shape[-1]
-                        for s in containers]):
+            n_samples = containers[0].shape[-1]
+            if not all(s.shape[-1] == n_samples for s in containers[1:]):
                 raise ValueError("Number of samples must match to concatenate"
                                  " events")
 
         def check_times():
-            if not all([s.time == containers[0].time for s in containers]):
+            time = containers[0].time
+            if not all(np.array_equal(s.time, time) for s in containers[1:]):
                 raise ValueError("Times must be the same for all series")
 
         def check_channels():
-            if not all([np.all(s.channels == containers[0].channels)
-                        for s in containers]):
+            # containers built from the same reader or by concatenate share
+            # the channels object, so avoid comparing labels in that case
+            channels = containers[0].channels
+            if not all(s.channels is channels or np.all(s.channels == channels)
+                       for s in containers[1:]):
                 raise ValueError("Channels must be the same for all series")
 
         def check_starts():
             if len(containers) == 1:
                 return
 
-            step = containers[0].samplerate / 1000.
-            last = containers[0].time[-1]
-            for s in containers[1:]:
-                if last + step != s.time[0]:
-                    raise ValueError("Start times are not properly aligned for"
-                                     " concatenation")
-                last += step
+            step = 1000. / containers[0].samplerate
+            n = len(containers)
+            starts = np.fromiter((s.tstart for s in containers[1:]),
+                                 dtype=np.float64, count=n - 1)
+            ends = np.fromiter((s.tstart + (s.shape[-1] - 1) * step
+                                for s in containers[:-1]),
+                               dtype=np.float64, count=n - 1)
+            if not np.allclose(starts, ends + step):
+                raise ValueError("Start times are not properly aligned for"
+                                 " concatenation")
 
         attrs = {
             key: [s.attrs.get(key, None) for s in containers]
             for key in containers[0].attrs.keys()
         }
 
-        if all([s.events is None for s in containers]):
+        if all(s.events is None for s in containers):
             all_events = None
         else:
             all_events = pd.concat([s.events for s in containers], sort=True)
@@ -165,28 +203,60 @@ class EEGContainer(object):
             check_samples()
             check_channels()
 
-            data = np.concatenate([s.data for s in containers], axis=0)
-            epochs = list(np.concatenate([s.epochs for s in containers]))
+            data = cls._concatenate_data(containers, axis=0)
+            epochs = np.concatenate([s.epochs for s in containers])
+            epochs = list(map(tuple, epochs.tolist()))
 
             return EEGContainer(data, samplerate,
                                 epochs=epochs,
                                 events=all_events,
                                 channels=containers[0].channels,
-                                tstart=containers[0].time[0],
+                                tstart=containers[0].tstart,
                                 attrs=attrs)
 
         elif dim == "time":
             check_channels()
             check_starts()
 
-            data = np.concatenate([s.data for s in containers], axis=2)
+            data = cls._concatenate_data(containers, axis=2)
             return EEGContainer(data, samplerate,
                                 epochs=containers[0].epochs,
                                 events=all_events,
                                 channels=containers[0].channels,
-                                tstart=containers[0].time[0],
+                                tstart=containers[0].tstart,
                                 attrs=attrs)
 
+    @staticmethod
+    def _concatenate_data(containers: List["EEGContainer"],
+                          axis: int) -> np.ndarray:
+        """Copy the data of each container into a single preallocated array
+        along ``axis``. Dtypes are promoted as with :func:`np.concatenate`.
+
+        """
+        arrays = [s.data for s in containers]
+        shape = list(arrays[0].shape)
+
+        # np.copyto would silently broadcast mismatched dimensions
+        for a in arrays[1:]:
+            if any(a.shape[i] != shape[i] for i in range(len(shape))
+                   if i != axis):
+                raise ValueError("Data shapes {} and {} cannot be concatenated"
+                                 " along axis {}".format(a.shape, tuple(shape),
+                                                         axis))
+
+        shape[axis] = sum(a.shape[axis] for a in arrays)
+        out = np.empty(shape, dtype=np.result_type(*arrays))
+
+        index = [slice(None)] * out.ndim
+        start = 0
+        for a in arrays:
+            stop = start + a.shape[axis]
+            index[axis] = slice(start, stop)
+            np.copyto(out[tuple(index)], a)
+            start = stop
+
+        return out
+
     @property
     def shape(self):
         """Get the shape of the data."""
@@ -195,7 +265,8 @@ class EEGContainer(object):
     @property
     def start_offsets(self) -> np.ndarray:
         """Returns the start offsets in samples for each epoch."""
-        return np.array([e[0] for e in self.epochs])
+        return np.fromiter((e[0] for e in self.epochs), dtype=np.int64,
+                           count=len(self.epochs))
 
     def resample(self, rate: Union[int, float]) -> "EEGContainer":
         """Resample the time series.
@@ -209,7 +280,7 @@ class EEGContainer(object):
         new_data, _ = scipy.signal.resample(self.data, new_len,
                                             t=self.time, axis=-1)
         return EEGContainer(new_data, rate, epochs=self.epochs,
-                            channels=self.channels, tstart=self.time[0],
+                            channels=self.channels, tstart=self.tstart,
                             attrs=self.attrs)
 
     def filter(self, filter) -> "EEGContainer":
@@ -218,6 +289,22 @@ class EEGContainer(object):
         """
         raise NotImplementedError
 
+    def _event_records(self) -> np.recarray:
+        """Events as a record array for export. When there are no events,
+        records are made from the epochs with ``eegoffset`` and
+        ``epoch_end`` as the first two columns.
+
+        """
+        if self.events is not None:
+            return self.events.to_records()
+
+        columns = ["eegoffset", "epoch_end"]
+        if len(self.epochs[0]) > 2:
+            columns = [columns[i] if i < 2 else "column_{}".format(i)
+                       for i in range(len(self.epochs[0]))]
+        return pd.DataFrame(self.epochs, columns=columns).to_records(
+            index=False)
+
     def to_ptsa(self) -> "TimeSeries":  # noqa: F821
         """Convert to a PTSA :class:`TimeSeriesX` object.
 
@@ -231,15 +318,7 @@ class EEGContainer(object):
 
         dims = ("event", "channel", "time")
 
-        if self.events is not None:
-            events = self.events.to_records()
-        else:
-            columns = ["eegoffset", "epoch_end"]
-            if len(self.epochs[0]) > 2:
-                columns = [columns[i] if i < 2 else "column_{}".format(i)
-                           for i in range(len(self.epochs[0]))]
-            events = pd.DataFrame(self.epochs, columns=columns).to_records(
-                index=False)
+        events = self._event_records()
 
         coords = {
             "event": events,
@@ -287,18 +366,10 @@ class EEGContainer(object):
             eeg = mne.io.RawArray(self.data[0], info, first_samp=0)
         # Return EpochsArray if loading epoched data
         else:
-            eeg = mne.EpochsArray(self.data, info, tmin=self.time[0] / 1000.)
+            eeg = mne.EpochsArray(self.data, info, tmin=self.tstart / 1000.)
 
         # Attach events to MNE object as record array
-        if self.events is not None:
-            events = self.events.to_records()
-        else:
-            columns = ["eegoffset", "epoch_end"]
-            if len(self.epochs[0]) > 2:
-                columns = [columns[i] if i < 2 else "column_{}".format(i)
-                           for i in range(len(self.epochs[0]))]
-            events = pd.DataFrame(self.epochs, columns=columns).to_records(
-                index=False)
+        events = self._event_records()
         eeg.info['events'] = events
 
         return eeg
@@ -1,6 +1,9 @@
 from abc import abstractmethod, ABC
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 import os
 from pathlib import Path
+import threading
 from typing import List, Tuple, Type, Union
 import warnings
 
@@ -22,6 +25,65 @@ from cmlreaders.util import get_protocol, get_root_dir
 from cmlreaders.warnings import MissingChannelsWarning
 
 
+# MNE readers are not thread-safe
+_MNE_LOCK = threading.Lock()
+
+# Raw data chunk cache settings used when opening Ramulator HDF5 files. The
+# number of hash slots is a prime well above the number of chunks that fit in
+# the cache for typical (~1 MB or smaller) chunk sizes.
+_H5_CHUNK_CACHE_NBYTES = 64 * 1024 ** 2
+_H5_CHUNK_CACHE_NSLOTS = 10007
+
+# Thread pool shared by all split EEG reads; see _channel_pool
+_CHANNEL_POOL = None  # type: ThreadPoolExecutor
+_CHANNEL_POOL_LOCK = threading.Lock()
+
+
+def _channel_pool() -> ThreadPoolExecutor:
+    """Return the thread pool used to read split EEG channel files. This is
+    created on first use and shared so that concurrent reads (e.g., of several
+    EEG files in :meth:`EEGReader.as_timeseries`) don't each start their own
+    threads.
+
+    """
+    global _CHANNEL_POOL
+
+    with _CHANNEL_POOL_LOCK:
+        if _CHANNEL_POOL is None:
+            _CHANNEL_POOL = ThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) + 4),
+                thread_name_prefix="cmlreaders-split-eeg",
+            )
+        return _CHANNEL_POOL
+
+
+# Minimum number of output samples before the numba kernels are used (when
+# available). Below this, JIT dispatch isn't worth it.
+_NUMBA_MIN_SIZE = 2 ** 20
+
+# Parallel numba kernels must not be launched from several threads at once
+# (not all threading layers support it).
+_NUMBA_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=None)
+def _numba_kernels():
+    """Import the numba kernels on first use so that importing cmlreaders
+    doesn't pay for importing numba.
+
+    Returns
+    -------
+    The :mod:`cmlreaders._numba_kernels` module or ``None`` when numba is not
+    installed.
+
+    """
+    try:
+        from cmlreaders import _numba_kernels
+    except ImportError:
+        return None
+    return _numba_kernels
+
+
 class EEGMetaReader(BaseCMLReader):
     """Reads the ``sources.json`` or ``params.txt`` files which describes
     metainfo about EEG data.
@@ -44,9 +106,10 @@ class EEGMetaReader(BaseCMLReader):
         df = pd.read_json(self.file_path, orient='index')
         sources_info = {}
         for k in df:
-            if any(df[k].apply(lambda x: isinstance(x, dict))):
+            values = df[k].values
+            if any(isinstance(x, dict) for x in values):
                 continue
-            v = df[k].unique()
+            v = pd.unique(values)
             sources_info[k] = v[0] if len(v) == 1 else v
         sources_info['path'] = self.file_path
         return sources_info
@@ -56,11 +119,16 @@ class EEGMetaReader(BaseCMLReader):
         sources.json.
 
         """
-        df = pd.read_table(self.file_path, sep=' ', header=None, index_col=0).T
+        params = {}
+        with open(self.file_path) as f:
+            for line in f:
+                key, _, value = line.strip().partition(" ")
+                if key:
+                    params[key] = value
 
         sources_info = {
-            "sample_rate": float(df["samplerate"].iloc[0]),
-            "data_format": df["dataformat"].str.replace("'", "").iloc[0],
+            "sample_rate": float(params["samplerate"]),
+            "data_format": params["dataformat"].replace("'", ""),
             "n_samples": None,
             "path": self.file_path,
         }
@@ -112,19 +180,29 @@ class BaseEEGReader(ABC):
         self.scheme = scheme
         self.clean = False if clean is None else clean
 
+        # contact numbers of pairs schemes as arrays
+        self._contact_1 = None  # type: np.ndarray
+        self._contact_2 = None  # type: np.ndarray
+
         try:
             if self.scheme_type == "contacts":
                 self._unique_contacts = self.scheme.contact.unique()
             elif self.scheme_type == "pairs":
-                self._unique_contacts = np.union1d(
-                    self.scheme["contact_1"],
-                    self.scheme["contact_2"]
-                )
+                self._contact_1 = self.scheme["contact_1"].values
+                self._contact_2 = self.scheme["contact_2"].values
+                self._unique_contacts = np.union1d(self._contact_1,
+                                                   self._contact_2)
             else:
                 self._unique_contacts = None
         except KeyError:
             self._unique_contacts = None
 
+        # for constant time lookups in include_contact
+        self._unique_contacts_set = (
+            set(self._unique_contacts.tolist())
+            if self._unique_contacts is not None else None
+        )
+
         # in cases where we can't rereference, this will get changed to False
         self.rereferencing_possible = True
 
@@ -160,10 +238,8 @@ class BaseEEGReader(ABC):
         reading data.
 
         """
-        if self._unique_contacts is not None:
-            return contact_num in self._unique_contacts
-        else:
-            return True
+        return (self._unique_contacts_set is None or
+                contact_num in self._unique_contacts_set)
 
     @abstractmethod
     def read(self) -> Tuple[np.ndarray, List[int]]:
@@ -194,28 +270,60 @@ class BaseEEGReader(ABC):
         be constructed manually.
 
         """
-        contact_to_index = {
-            c: i
-            for i, c in enumerate(contacts)
-        }
-
         if self.scheme_type == "pairs":
-            c1 = [contact_to_index[c] for c in self.scheme["contact_1"]
-                  if c in contact_to_index]
-            c2 = [contact_to_index[c] for c in self.scheme["contact_2"]
-                  if c in contact_to_index]
+            c1, found_1 = self._contact_indices(contacts, self._contact_1)
+            c2, found_2 = self._contact_indices(contacts, self._contact_2)
+            c1, c2 = c1[found_1], c2[found_2]
+
+            shape = (data.shape[0], len(c1), data.shape[2])
+
+            kernels = None
+            if len(c1) == len(c2) and np.prod(shape) >= _NUMBA_MIN_SIZE:
+                kernels = _numba_kernels()
+
+            if kernels is not None:
+                reref = np.empty(shape, dtype=data.dtype)
+                with _NUMBA_LOCK:
+                    kernels.bipolar_diff(data, c1, c2, reref)
+            else:
+                reref = np.subtract(data[:, c1, :], data[:, c2, :])
 
-            reref = np.array(
-                [data[i, c1, :] - data[i, c2, :] for i in range(data.shape[0])]
-            )
             return reref, self.scheme["label"].tolist()
         else:
-            channels = [contact_to_index[c] for c in self.scheme["contact"]]
-            subset = np.array(
-                [data[i, channels, :] for i in range(data.shape[0])]
-            )
+            contact = self.scheme["contact"].values
+            channels, found = self._contact_indices(contacts, contact)
+            if not found.all():
+                raise KeyError(contact[~found][0])
+            subset = data[:, channels, :]
             return subset, self.scheme["label"].tolist()
 
+    @staticmethod
+    def _contact_indices(contacts: List[int],
+                         values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Look up the channel index of each contact number in ``values``.
+
+        Returns
+        -------
+        indices
+            Index into ``contacts`` for each value (the last one if a contact
+            is repeated). Only meaningful where ``found`` is True.
+        found
+            Mask of values present in ``contacts``.
+
+        """
+        contacts = np.asarray(contacts)
+        values = np.asarray(values)
+
+        if not len(contacts):
+            return (np.zeros(len(values), dtype=np.intp),
+                    np.zeros(len(values), dtype=bool))
+
+        sorter = np.argsort(contacts, kind="mergesort")
+        pos = np.searchsorted(contacts, values, side="right", sorter=sorter)
+        indices = sorter[np.maximum(pos - 1, 0)].astype(np.intp)
+        found = contacts[indices] == values
+        return indices, found
+
 
 class NumpyEEGReader(BaseEEGReader):
     """Read EEG data stored in Numpy's .npy format.
@@ -228,9 +336,20 @@ class NumpyEEGReader(BaseEEGReader):
 
     """
     def read(self) -> Tuple[np.ndarray, List[int]]:
-        raw = np.load(self.filename)
-        data = np.array([raw[:, e[0]:(e[1] if e[1] > 0 else None)]
-                         for e in self.epochs])
+        raw = np.load(self.filename, mmap_mode="r")
+        windows = [slice(e[0], e[1] if e[1] > 0 else None)
+                   for e in self.epochs]
+        lengths = {len(range(*w.indices(raw.shape[1]))) for w in windows}
+
+        if len(lengths) == 1:
+            # copy each epoch straight into the output instead of going
+            # through an intermediate list of arrays
+            data = np.empty((len(windows), raw.shape[0], lengths.pop()),
+                            dtype=raw.dtype)
+            for i, window in enumerate(windows):
+                np.copyto(data[i], raw[:, window])
+        else:
+            data = np.array([raw[:, window] for window in windows])
         contacts = [i + 1 for i in range(data.shape[1])]
         return data, contacts
 
@@ -270,13 +389,70 @@ class SplitEEGReader(BaseEEGReader):
             contacts.append(contact_num)
             memmaps.append(np.memmap(f, dtype=self.dtype, mode='r'))
 
-        data = np.array([
+        data = self._read_epochs(memmaps)
+        return data, contacts
+
+    def _read_epochs(self, memmaps: List[np.memmap]) -> np.ndarray:
+        """Read epochs from memory-mapped channel files.
+
+        When all epochs have the same length and select the same samples from
+        every channel, each channel is read for every epoch at once with a
+        single gather into a preallocated array. Otherwise, fall back to
+        slicing each channel for each epoch.
+
+        """
+        def get_windows(n):
+            return np.array([
+                slice(epoch[0], epoch[1]).indices(n)[:2]
+                for epoch in self.epochs
+            ], dtype=np.intp).reshape(-1, 2)
+
+        n_samples = [len(mmap) for mmap in memmaps]
+
+        if len(n_samples):
+            windows = get_windows(min(n_samples))
+            lengths = np.unique(windows[:, 1] - windows[:, 0])
+
+            # channels with differing numbers of samples can still share the
+            # same windows as long as every epoch fits in the shortest one
+            shared = min(n_samples) == max(n_samples) or \
+                np.array_equal(windows, get_windows(max(n_samples)))
+
+            if shared and len(lengths) == 1 and lengths[0] > 0:
+                data = np.empty((len(windows), len(memmaps), lengths[0]),
+                                dtype=self.dtype)
+
+                kernels = None
+                if data.size >= _NUMBA_MIN_SIZE:
+                    kernels = _numba_kernels()
+
+                if kernels is not None:
+                    starts = np.ascontiguousarray(windows[:, 0])
+
+                    def read_channel(i):
+                        kernels.copy_epochs(np.asarray(memmaps[i]), starts,
+                                            data[:, i, :])
+                else:
+                    indices = windows[:, :1] + np.arange(lengths[0])
+
+                    def read_channel(i):
+                        data[:, i, :] = memmaps[i][indices]
+
+                # Page faults on the memmaps happen with the GIL released,
+                # so channel files can be read concurrently.
+                if len(memmaps) > 1:
+                    list(_channel_pool().map(read_channel,
+                                             range(len(memmaps))))
+                else:
+                    read_channel(0)
+
+                return data
+
+        return np.array([
             [mmap[epoch[0]:epoch[1]] for mmap in memmaps]
             for epoch in self.epochs
         ])
 
-        return data, contacts
-
 
 class EDFReader(BaseEEGReader):
     def read(self) -> Tuple[np.ndarray, List[int]]:
@@ -285,8 +461,13 @@ class EDFReader(BaseEEGReader):
 
 class RamulatorHDF5Reader(BaseEEGReader):
     """Reads Ramulator HDF5 EEG files."""
+    # bipolar pairs recorded in the file; populated by read
+    _pairs = None  # type: np.ndarray
+
     def read(self) -> Tuple[np.ndarray, List[int]]:
-        with h5py.File(self.filename, 'r') as hfile:
+        with h5py.File(self.filename, 'r',
+                       rdcc_nbytes=_H5_CHUNK_CACHE_NBYTES,
+                       rdcc_nslots=_H5_CHUNK_CACHE_NSLOTS) as hfile:
             try:
                 self.rereferencing_possible = \
                     bool(hfile['monopolar_possible'][0])
@@ -299,23 +480,30 @@ class RamulatorHDF5Reader(BaseEEGReader):
 
             # Check for duplicated channels
             if 'bipolar_info' in hfile:
-                bpinfo = hfile['bipolar_info']
-                all_nums = [
-                    (int(a), int(b))
-                    for (a, b) in list(
-                        zip(bpinfo['ch0_label'][:], bpinfo['ch1_label'][:])
-                    )
-                ]
-                idxs = np.empty(len(all_nums), dtype=bool)
-                idxs.fill(True)
-                for i, pair in enumerate(all_nums):
-                    if pair in all_nums[:i] or pair[::-1] in all_nums[:i]:
-                        idxs[i] = False
+                pairs = self._bipolar_pairs(hfile['bipolar_info'])
+                self._pairs = pairs
+
+                # pairs are duplicates regardless of order; keep the first
+                _, first = np.unique(self._canonical_pairs(pairs),
+                                     return_index=True)
+                idxs = np.zeros(len(pairs), dtype=bool)
+                idxs[first] = True
             else:
                 idxs = np.array([True for _ in hfile['ports']])
 
+            row_major = 'orient' in ts.attrs.keys() and \
+                ts.attrs['orient'] == b'row'
+            n_samples = ts.shape[0] if row_major else ts.shape[1]
+            windows = [
+                slice(*slice(epoch[0], epoch[1]).indices(n_samples)[:2])
+                for epoch in self.epochs
+            ]
+            lengths = {window.stop - window.start for window in windows}
+
             # Only select channels we care about
-            if 'orient' in ts.attrs.keys() and ts.attrs['orient'] == b'row':
+            if len(lengths) == 1 and lengths.pop() > 0:
+                data = self._read_epochs(ts, windows, idxs, row_major)
+            elif row_major:
                 data = np.array(
                     [ts[epoch[0]:epoch[1], idxs].T for epoch in self.epochs])
             else:
@@ -326,6 +514,133 @@ class RamulatorHDF5Reader(BaseEEGReader):
 
             return data, contacts
 
+    @staticmethod
+    def _read_epochs(ts: h5py.Dataset, windows: List[slice], idxs: np.ndarray,
+                     row_major: bool) -> np.ndarray:
+        """Read equally sized epochs into a preallocated array.
+
+        Data is read for all channels with contiguous
+        :meth:`h5py.Dataset.read_direct` calls and channels are only selected
+        once the data is in memory, which is much faster than letting h5py
+        handle the boolean channel selection. Column-major epochs which need
+        no channel selection are read directly into the output. When the
+        dataset is chunked along the time axis, neighbouring epochs are read
+        together in chunk-aligned blocks so that each chunk is only
+        decompressed once.
+
+        """
+        n_times = windows[0].stop - windows[0].start
+        data = np.empty((len(windows), int(idxs.sum()), n_times),
+                        dtype=ts.dtype)
+
+        time_axis = 0 if row_major else 1
+        n_channels = ts.shape[1 - time_axis]
+
+        if ts.chunks is None:
+            blocks = [(window, [i]) for i, window in enumerate(windows)]
+        else:
+            max_len = max(
+                n_times,
+                _H5_CHUNK_CACHE_NBYTES // (n_channels * ts.dtype.itemsize),
+            )
+            blocks = RamulatorHDF5Reader._aligned_blocks(
+                windows, ts.chunks[time_axis], ts.shape[time_axis], max_len
+            )
+
+        # column-major epochs of all channels can go straight into the output
+        direct = not row_major and idxs.all()
+
+        for block, members in blocks:
+            if direct and len(members) == 1 and block == windows[members[0]]:
+                ts.read_direct(data, source_sel=np.s_[:, block],
+                               dest_sel=np.s_[members[0]])
+                continue
+
+            n_block = block.stop - block.start
+            if row_major:
+                buffer = np.empty((n_block, n_channels), dtype=ts.dtype)
+                ts.read_direct(buffer, source_sel=np.s_[block, :])
+            else:
+                buffer = np.empty((n_channels, n_block), dtype=ts.dtype)
+                ts.read_direct(buffer, source_sel=np.s_[:, block])
+
+            for i in members:
+                offset = windows[i].start - block.start
+                if row_major:
+                    data[i] = buffer[offset:offset + n_times, idxs].T
+                else:
+                    data[i] = buffer[idxs, offset:offset + n_times]
+
+        return data
+
+    @staticmethod
+    def _aligned_blocks(windows: List[slice], chunk: int, n_samples: int,
+                        max_len: int) -> List[Tuple[slice, List[int]]]:
+        """Group epoch windows into chunk-aligned blocks to read at once.
+
+        Parameters
+        ----------
+        windows
+            Normalized epoch windows along the time axis.
+        chunk
+            Chunk size along the time axis.
+        n_samples
+            Total number of samples along the time axis.
+        max_len
+            Maximum number of samples to read in one block. Epochs which
+            would grow a block past this start a new block, and epochs whose
+            chunk-aligned span alone is longer than this are read as their
+            exact window.
+
+        Returns
+        -------
+        A list of ``(block, members)`` pairs where ``members`` are the
+        indices of the windows contained in ``block``.
+
+        """
+        blocks = []
+        for i in sorted(range(len(windows)), key=lambda i: windows[i].start):
+            start = windows[i].start // chunk * chunk
+            stop = min(-(-windows[i].stop // chunk) * chunk, n_samples)
+
+            # don't read whole chunks when they're much longer than the epoch
+            if stop - start > max_len:
+                blocks.append((windows[i], [i]))
+                continue
+
+            if blocks:
+                block, members = blocks[-1]
+                if start <= block.stop and \
+                        max(stop, block.stop) - block.start <= max_len:
+                    blocks[-1] = (
+                        slice(block.start, max(stop, block.stop)), members
+                    )
+                    members.append(i)
+                    continue
+
+            blocks.append((slice(start, stop), [i]))
+
+        return blocks
+
+    @staticmethod
+    def _bipolar_pairs(bpinfo: h5py.Group) -> np.ndarray:
+        """Read the recorded bipolar pairs as an ``(n, 2)`` integer array."""
+        return np.column_stack([
+            np.asarray(bpinfo['ch0_label'][:]).astype(np.int64),
+            np.asarray(bpinfo['ch1_label'][:]).astype(np.int64),
+        ]).reshape(-1, 2)
+
+    @staticmethod
+    def _canonical_pairs(pairs: np.ndarray) -> np.ndarray:
+        """Pack each ``(n, 2)`` pair into a single int64 key so that pairs can
+        be compared as plain integers regardless of order. Contact numbers
+        must fit in 32 bits.
+
+        """
+        lo = np.minimum(pairs[:, 0], pairs[:, 1]).astype(np.int64)
+        hi = np.maximum(pairs[:, 0], pairs[:, 1]).astype(np.int64)
+        return (lo << 32) | (hi & 0xFFFFFFFF)
+
     def rereference(self, data: np.ndarray,
                     contacts: List[int]) -> Tuple[np.ndarray, List[str]]:
         """Overrides the default rereferencing to first check validity of the
@@ -335,46 +650,44 @@ class RamulatorHDF5Reader(BaseEEGReader):
         if self.rereferencing_possible or self.scheme_type == "contacts":
             return BaseEEGReader.rereference(self, data, contacts)
 
-        with h5py.File(self.filename, 'r') as hfile:
-            bpinfo = hfile['bipolar_info']
-            all_nums = [
-                (int(a), int(b))
-                for (a, b) in zip(
-                    bpinfo['ch0_label'][:], bpinfo['ch1_label'][:]
-                )
-            ]
+        pairs = self._pairs
+        if pairs is None:
+            with h5py.File(self.filename, 'r') as hfile:
+                pairs = self._bipolar_pairs(hfile['bipolar_info'])
 
         # Create a mask of channels that appear in both the passed scheme and
         # the recorded data.
-        all_nums_array = np.asarray(all_nums)
         valid_mask = (
-            (self.scheme["contact_1"].isin(all_nums_array[:, 0])) &
-            (self.scheme["contact_2"].isin(all_nums_array[:, 1]))
+            np.isin(self._contact_1, pairs[:, 0]) &
+            np.isin(self._contact_2, pairs[:, 1])
         )
 
-        if not len(self.scheme[valid_mask]):
+        if not valid_mask.any():
             raise exc.RereferencingNotPossibleError(
                 "No channels specified in scheme are present in EEG recording"
             )
 
-        if len(self.scheme[valid_mask]) < len(self.scheme):
+        all_labels = self.scheme["label"].values
+
+        if not valid_mask.all():
             # Some channels included in the scheme are not present in the
             # actual recording
             msg = (
                 "The following channels are missing: {:s}".format(
-                    ", ".join(self.scheme[~valid_mask]["label"])
+                    ", ".join(all_labels[~valid_mask])
                 )
             )
             warnings.warn(msg, MissingChannelsWarning)
 
-        # Handle missing channels
-        scheme_nums = list(zip(self.scheme[valid_mask]["contact_1"],
-                               self.scheme[valid_mask]["contact_2"]))
-        labels = self.scheme[valid_mask]["label"].tolist()
+        # Handle missing channels; pairs match regardless of order
+        scheme_pairs = np.column_stack([
+            self._contact_1[valid_mask], self._contact_2[valid_mask]
+        ]).astype(np.int64)
+        labels = all_labels[valid_mask].tolist()
 
         # allow a subset of channels
-        channel_inds = [chan in scheme_nums or (chan[1], chan[0]) in
-                        scheme_nums for chan in list(all_nums)]
+        channel_inds = np.isin(self._canonical_pairs(pairs),
+                               self._canonical_pairs(scheme_pairs))
         return data[:, channel_inds, :], labels
 
 
@@ -411,16 +724,21 @@ class ScalpEEGReader(BaseEEGReader):
         else:
             # Remove any events that run beyond the beginning or end of the EEG
             # recording
-            truncated_events_pre = 0
-            truncated_events_post = 0
-            while self.epochs['epochs'][0, 0] + eeg.info['sfreq'] * \
-                    self.epochs['tmin'] < 0:
-                self.epochs['epochs'] = self.epochs['epochs'][1:]
-                truncated_events_pre += 1
-            while self.epochs['epochs'][-1, 0] + eeg.info['sfreq'] * \
-                    self.epochs['tmax'] >= eeg.n_times:
-                self.epochs['epochs'] = self.epochs['epochs'][:-1]
-                truncated_events_post += 1
+            def n_leading(mask):
+                return len(mask) if mask.all() else int(np.argmin(mask))
+
+            onsets = self.epochs['epochs'][:, 0]
+            sfreq = eeg.info['sfreq']
+            truncated_events_pre = n_leading(
+                onsets + sfreq * self.epochs['tmin'] < 0
+            )
+            truncated_events_post = n_leading(
+                onsets[truncated_events_pre:][::-1] +
+                sfreq * self.epochs['tmax'] >= eeg.n_times
+            )
+            self.epochs['epochs'] = self.epochs['epochs'][
+                truncated_events_pre:len(onsets) - truncated_events_post
+            ]
             # Cut continuous data into epochs
             eeg = mne.Epochs(eeg, self.epochs['epochs'],
                              tmin=self.epochs['tmin'],
@@ -479,33 +797,39 @@ class EEGReader(BaseCMLReader):
 
     def _eegfile_absolute(self, events: pd.DataFrame) -> pd.DataFrame:
         """Convert possibly relative paths to EEG files in events to absolute
-        paths.
+        paths. The passed events are not modified; a new frame is returned
+        only when some paths need converting.
 
         """
         # Only reformat if we have relative path names. Data stored in
         # /protocols usually uses relative paths, whereas the older, Matlab-
         # based event processing uses absolute paths.
-        def to_absolute(row):
-            if row["eegfile"].startswith("/"):
-                return row["eegfile"]
-
-            subject = self.subject \
-                if self.subject is not None else row["subject"]
-            experiment = self.experiment \
-                if self.experiment is not None else row["experiment"]
-            session = self.session \
-                if self.session is not None else row["session"]
-
-            return "/" + constants.rhino_paths["processed_eeg"][0].format(
+        relative = ~events["eegfile"].str.startswith("/", na=True)
+        if not relative.any():
+            return events
+
+        rows = events[relative]
+
+        def values(key):
+            value = getattr(self, key)
+            return rows[key] if value is None else [value] * len(rows)
+
+        template = "/" + constants.rhino_paths["processed_eeg"][0]
+        eegfile = events["eegfile"].copy()
+        eegfile[relative] = [
+            template.format(
                 protocol=get_protocol(subject),
                 subject=subject,
                 experiment=experiment,
                 session=session,
-                basename=row["eegfile"]
+                basename=basename,
             )
-
-        events.loc[:, "eegfile"] = events.apply(to_absolute, axis=1)
-        return events
+            for subject, experiment, session, basename in zip(
+                values("subject"), values("experiment"), values("session"),
+                rows["eegfile"]
+            )
+        ]
+        return events.assign(eegfile=eegfile)
 
     def load(self, **kwargs):
         """Overrides the generic load method so as to accept keyword arguments
@@ -574,7 +898,7 @@ class EEGReader(BaseCMLReader):
         self.clean = kwargs.get("clean", None)
         self.scheme = kwargs.get("scheme", None)
 
-        events = self._eegfile_absolute(events.copy())
+        events = self._eegfile_absolute(events)
         return self.as_timeseries(events, kwargs["rel_start"],
                                   kwargs["rel_stop"])
 
@@ -626,99 +950,134 @@ class EEGReader(BaseCMLReader):
             When rereferencing is not possible.
 
         """
-        eegs = []
-
         # sanity check on the offsets
 
         if rel_start != 0 and rel_stop != -1 and rel_start > rel_stop:
             raise ValueError('rel_start must precede rel_stop')
 
-        for filename in events["eegfile"].unique():
-            # select subset of events for this basename
-            ev = events[events["eegfile"] == filename]
+        # partition events by EEG file in a single pass
+        groups = list(events.groupby("eegfile", sort=False))
+        whole_session = rel_start == 0 and rel_stop == -1 and len(events) == 1
+        load_one = partial(self._load_one, rel_start=rel_start,
+                           rel_stop=rel_stop, whole_session=whole_session)
+
+        # Reading each file is independent and mostly I/O bound, so overlap
+        # reads across files.
+        if len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as ex:
+                results = list(ex.map(lambda group: load_one(*group), groups))
+        else:
+            results = [load_one(filename, ev) for filename, ev in groups]
+
+        eegs, rereferencing_possible = zip(*results)
+        eegs = EEGContainer.concatenate(list(eegs))
+        eegs.attrs["rereferencing_possible"] = rereferencing_possible[-1]
+        return eegs
 
-            # determine experiment, session, dtype, and sample rate
-            experiment = ev["experiment"].unique()[0]
-            session = ev["session"].unique()[0]
-            basename = os.path.basename(filename)
-            finder = PathFinder(subject=self.subject,
-                                experiment=experiment,
-                                session=session,
-                                eeg_basename=basename,
-                                rootdir=self.rootdir)
-            sources = EEGMetaReader.fromfile(finder.find("sources"),
-                                             subject=self.subject)
-            sample_rate = sources["sample_rate"]
-            dtype = sources["data_format"]
-            is_scalp = dtype in (".bdf", ".raw", ".mff")
-
-            # Convert events to epochs (onset & offset times)
-            if rel_start == 0 and rel_stop == -1 and len(events) == 1:
-                epochs = [(0, None)]
-            else:
-                epochs = convert.events_to_epochs(ev, rel_start, rel_stop,
-                                                  sample_rate)
-
-            # Scalp EEG reader requires onsets, rel_start (in sec), and rel_
-            # stop (in sec) to cut data into epochs
-            if is_scalp:
-                on_off_epochs = epochs  # The onset & offset times will still
-                # be passed to the EEGContainer later
-                if rel_start == 0 and rel_stop == -1 and len(events) == 1:
-                    epochs = None
-                else:
-                    epochs = np.zeros((len(ev), 3), dtype=int)
-                    epochs[:, 0] = ev["eegoffset"]
-                    epochs = dict(epochs=epochs, tmin=rel_start / 1000.,
-                                  tmax=rel_stop / 1000.)
-
-            root = get_root_dir(self.rootdir)
-            eeg_filename = os.path.join(root, filename.lstrip("/"))
-            reader_class = self._get_reader_class(filename)
-            reader = reader_class(filename=eeg_filename,
-                                  dtype=dtype,
-                                  epochs=epochs,
-                                  scheme=self.scheme,
-                                  clean=self.clean)
-            # if scalp EEG, info is an MNE Info object; if iEEG, info is a list
-            # of contacts
-            data, info = reader.read()
+    def _load_one(self, filename: str, ev: pd.DataFrame,
+                  rel_start: Union[float, int], rel_stop: Union[float, int],
+                  whole_session: bool) -> Tuple[EEGContainer, bool]:
+        """Read the timeseries for all events recorded in a single EEG file.
+
+        Parameters
+        ----------
+        filename
+            EEG file path as given in the events.
+        ev
+            Events recorded in ``filename``.
+        rel_start
+            Relative start times in ms
+        rel_stop
+            Relative stop times in ms
+        whole_session
+            Read the entire recording instead of epochs around events.
+
+        Returns
+        -------
+        The EEG container for the file and whether rereferencing is possible.
 
-            attrs = {}
-            if is_scalp:
-                # Pass MNE info and events as extra attributes, to be able to
-                # fully reconstruct MNE Raw/Epochs objects
-                attrs["mne_info"] = info
-                channels = info["ch_names"]
-                if epochs is not None:
-                    # Crop out any events/epoch times that ran beyond the
-                    # bounds of the EEG recording
-                    te_pre = info["truncated_events_pre"] \
-                        if info["truncated_events_pre"] > 0 else None
-                    te_post = -info["truncated_events_post"] \
-                        if info["truncated_events_post"] > 0 else None
-                    on_off_epochs = on_off_epochs[te_pre:te_post]
-                    ev = ev[te_pre:te_post]
-                # Pass the onset & offset time epoch list to EEGContainer, NOT
-                # the MNE-formatted epoch list
-                epochs = on_off_epochs
-            elif self.scheme is not None:
-                data, channels = reader.rereference(data, info)
+        """
+        # determine experiment, session, dtype, and sample rate
+        experiment = ev["experiment"].unique()[0]
+        session = ev["session"].unique()[0]
+        basename = os.path.basename(filename)
+        finder = PathFinder(subject=self.subject,
+                            experiment=experiment,
+                            session=session,
+                            eeg_basename=basename,
+                            rootdir=self.rootdir)
+        sources = EEGMetaReader.fromfile(finder.find("sources"),
+                                         subject=self.subject)
+        sample_rate = sources["sample_rate"]
+        dtype = sources["data_format"]
+        is_scalp = dtype in (".bdf", ".raw", ".mff")
+
+        # Convert events to epochs (onset & offset times)
+        if whole_session:
+            epochs = [(0, None)]
+        else:
+            epochs = convert.events_to_epochs(ev, rel_start, rel_stop,
+                                              sample_rate)
+
+        # Scalp EEG reader requires onsets, rel_start (in sec), and rel_
+        # stop (in sec) to cut data into epochs
+        if is_scalp:
+            on_off_epochs = epochs  # The onset & offset times will still
+            # be passed to the EEGContainer later
+            if whole_session:
+                epochs = None
             else:
-                channels = ["CH{}".format(n + 1) for n in range(data.shape[1])]
-
-            eegs.append(
-                EEGContainer(
-                    data,
-                    sample_rate,
-                    epochs=epochs,
-                    events=ev,
-                    channels=channels,
-                    tstart=rel_start,
-                    attrs=attrs
-                )
-            )
+                epochs = np.zeros((len(ev), 3), dtype=int)
+                epochs[:, 0] = ev["eegoffset"]
+                epochs = dict(epochs=epochs, tmin=rel_start / 1000.,
+                              tmax=rel_stop / 1000.)
+
+        root = get_root_dir(self.rootdir)
+        eeg_filename = os.path.join(root, filename.lstrip("/"))
+        reader_class = self._get_reader_class(filename)
+        reader = reader_class(filename=eeg_filename,
+                              dtype=dtype,
+                              epochs=epochs,
+                              scheme=self.scheme,
+                              clean=self.clean)
+        # if scalp EEG, info is an MNE Info object; if iEEG, info is a list
+        # of contacts. MNE is not thread-safe so scalp reads are serialized.
+        if is_scalp:
+            with _MNE_LOCK:
+                data, info = reader.read()
+        else:
+            data, info = reader.read()
 
-        eegs = EEGContainer.concatenate(eegs)
-        eegs.attrs["rereferencing_possible"] = reader.rereferencing_possible
-        return eegs
+        attrs = {}
+        if is_scalp:
+            # Pass MNE info and events as extra attributes, to be able to
+            # fully reconstruct MNE Raw/Epochs objects
+            attrs["mne_info"] = info
+            channels = info["ch_names"]
+            if epochs is not None:
+                # Crop out any events/epoch times that ran beyond the
+                # bounds of the EEG recording
+                te_pre = info["truncated_events_pre"] \
+                    if info["truncated_events_pre"] > 0 else None
+                te_post = -info["truncated_events_post"] \
+                    if info["truncated_events_post"] > 0 else None
+                on_off_epochs = on_off_epochs[te_pre:te_post]
+                ev = ev[te_pre:te_post]
+            # Pass the onset & offset time epoch list to EEGContainer, NOT
+            # the MNE-formatted epoch list
+            epochs = on_off_epochs
+        elif self.scheme is not None:
+            data, channels = reader.rereference(data, info)
+        else:
+            channels = ["CH{}".format(n + 1) for n in range(data.shape[1])]
+
+        eeg = EEGContainer(
+            data,
+            sample_rate,
+            epochs=epochs,
+            events=ev,
+            channels=channels,
+            tstart=rel_start,
+            attrs=attrs
+        )
+        return eeg, reader.rereferencing_possible
@@ -1,18 +1,62 @@
-import json
+from functools import lru_cache
+import os
 import os.path
+from typing import List
 import scipy.io as sio
 import numpy as np
 
 import pandas as pd
 from pandas.io.json import json_normalize
 
-from cmlreaders import exc
+from cmlreaders import cache, exc
 from cmlreaders.base_reader import BaseCMLReader
 from cmlreaders.readers.readers import MNICoordinatesReader
+from cmlreaders.util import load_json
 import cmlreaders.warnings
 import warnings
 
 
+@lru_cache(maxsize=32)
+def _read_montage_records(path: str, mtime: int, data_type: str) -> List[dict]:
+    """Parse a JSON montage file into flat per-channel records.
+
+    Parameters
+    ----------
+    path
+        Path to contacts.json or pairs.json.
+    mtime
+        Modification time of ``path`` in nanoseconds. This is only used to
+        invalidate cached results when the file changes.
+    data_type
+        ``"contacts"`` or ``"pairs"``.
+
+    Returns
+    -------
+    One dict per channel with atlas entries flattened to ``atlas.key``
+    columns. The result is cached, so callers must not mutate it.
+
+    """
+    raw = load_json(path)
+
+    subject_key = [key for key in raw.keys() if key != "version"][0]
+    pairs = raw[subject_key][data_type]
+
+    records = []
+    for pair, data in pairs.items():
+        atlases = data.pop("atlases", {})
+
+        for atlas_label, atlas_data in atlases.items():
+            data.update({
+                "{}.{}".format(atlas_label, key): value
+                for key, value in atlas_data.items()
+                if not key.endswith("id")  # this just duplicates the key
+            })
+
+        records.append(data)
+
+    return records
+
+
 class MontageReader(BaseCMLReader):
     """Reads montage files (contacts.json, pairs.json). When loading via
     :meth:`CMLReader.load`, pass ``read_categories=True`` to additionally load
@@ -112,31 +156,20 @@ class MontageReader(BaseCMLReader):
 
     def _as_dataframe_json(self):
         """Load montage data from newer JSON formats."""
-        with open(self.file_path) as f:
-            raw = json.load(f)
-
-            # we're using fromfile, so we need to infer subject/data_type
-            if not len(self.data_type):
-                self.data_type = (
-                    "contacts" if "contacts" in os.path.basename(
-                        self.file_path) else "pairs"
-                )
-
-            subject_key = [key for key in raw.keys() if key != "version"][0]
-            pairs = raw[subject_key][self.data_type]
-
-        records = []
-        for pair, data in pairs.items():
-            atlases = data.pop("atlases", {})
+        # we're using fromfile, so we need to infer subject/data_type
+        if not len(self.data_type):
+            self.data_type = (
+                "contacts" if "contacts" in os.path.basename(
+                    self.file_path) else "pairs"
+            )
 
-            for atlas_label, atlas_data in atlases.items():
-                data.update({
-                    "{}.{}".format(atlas_label, key): value
-                    for key, value in atlas_data.items()
-                    if not key.endswith("id")  # this just duplicates the key
-                })
+        if cache.enabled:
+            read = _read_montage_records
+        else:
+            read = _read_montage_records.__wrapped__
 
-            records.append(data)
+        mtime = os.stat(self.file_path).st_mtime_ns
+        records = read(self.file_path, mtime, self.data_type)
 
         df = pd.DataFrame(records)
 
@@ -251,8 +284,7 @@ class LocalizationReader(BaseCMLReader):
     def as_dataframe(self):
         import itertools
 
-        with open(self.file_path) as f:
-            data = json.load(f)
+        data = load_json(self.file_path)
 
         leads = list(data['leads'].values())
 
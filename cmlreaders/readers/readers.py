@@ -1,8 +1,4 @@
-import json
-import warnings
-
 import pandas as pd
-from pandas.errors import ParserWarning
 from pandas.io.json import json_normalize
 import scipy.io as sio
 
@@ -10,6 +6,7 @@ from cmlreaders.base_reader import BaseCMLReader
 from cmlreaders.exc import (
     MissingParameter, UnmetOptionalDependencyError, UnsupportedRepresentation,
 )
+from cmlreaders.util import load_json
 
 
 class TextReader(BaseCMLReader):
@@ -40,12 +37,10 @@ class TextReader(BaseCMLReader):
         else:
             sep = ","  # read_csv's default value
 
-        # When sep is None, we get a warning that the Python parser is slower,
-        # but for jacksheet files, it automatically DTRT and the file is small
-        # enough for speed to not be an issue.
-        with warnings.catch_warnings():
-            warnings.filterwarnings("ignore", category=ParserWarning)
-            df = pd.read_csv(self.file_path, sep=sep, names=self._headers)
+        # Both separators are supported by the C parser; make sure we never
+        # silently fall back to the much slower Python one.
+        df = pd.read_csv(self.file_path, sep=sep, names=self._headers,
+                         engine="c")
 
         return df
 
@@ -110,17 +105,14 @@ class RamulatorEventLogReader(BaseCMLReader):
                                                       rootdir=rootdir)
 
     def as_dataframe(self):
-        with open(self.file_path, 'r') as efile:
-            raw = json.loads(efile.read())['events']
+        raw = load_json(self.file_path)['events']
 
         exclude = ['to_id', 'from_id', 'event_id', 'command_id']
         df = json_normalize(raw)
         return df.drop(exclude, axis=1)
 
     def as_dict(self):
-        with open(self.file_path, 'r') as efile:
-            raw_dict = json.load(efile)
-        return raw_dict
+        return load_json(self.file_path)
 
 
 class BaseJSONReader(BaseCMLReader):
@@ -1,10 +1,13 @@
 from copy import copy
-from pkg_resources import resource_filename
+from unittest.mock import patch
+
+import pandas as pd
 import pytest
 
 from cmlreaders import cache
 from cmlreaders.base_reader import BaseCMLReader
 from cmlreaders.readers.electrodes import MontageReader
+from cmlreaders.test.utils import datafile
 
 
 @pytest.fixture(params=[True, False])
@@ -17,7 +20,7 @@ def caching_enabled(request):
 
 @pytest.fixture
 def contacts_reader():
-    path = resource_filename("cmlreaders.test.data", "R1006P_contacts.json")
+    path = datafile("R1006P_contacts.json")
     mr = MontageReader("contacts", "R1006P", file_path=path)
     yield mr
     mr.clear_cache()
@@ -26,7 +29,7 @@ def contacts_reader():
 
 @pytest.fixture
 def pairs_reader():
-    path = resource_filename("cmlreaders.test.data", "R1006P_pairs.json")
+    path = datafile("R1006P_pairs.json")
     mr = MontageReader("pairs", "R1006P", file_path=path)
     yield mr
     mr.clear_cache()
@@ -49,6 +52,23 @@ def test_clear_all(caching_enabled, contacts_reader, pairs_reader):
     assert pairs_reader._result is None
 
 
+def test_clear_all_index():
+    from cmlreaders.cmlreader import _cached_index
+
+    index = pd.DataFrame({
+        "subject": ["R1001P"],
+        "experiment": ["FR1"],
+        "session": [0],
+    })
+
+    with patch("cmlreaders.cmlreader.get_data_index", return_value=index):
+        _cached_index("r1", "/")
+
+    assert _cached_index.cache_info().currsize > 0
+    cache.clear_all()
+    assert _cached_index.cache_info().currsize == 0
+
+
 def test_enable(caching_enabled):
     cache.enable()
     assert cache.enabled
@@ -62,7 +82,7 @@ def test_disable(caching_enabled, clear):
 
 def test_in_memory_caching(caching_enabled):
     """Test in-memory caching."""
-    path = resource_filename("cmlreaders.test.data", "R1006P_contacts.json")
+    path = datafile("R1006P_contacts.json")
     mr = MontageReader("contacts", "R1006P", file_path=path)
     df = mr.load()
 
@@ -1,27 +1,24 @@
 from contextlib import ExitStack
-import functools
 import os
 from unittest.mock import patch
 
 import pandas as pd
-from pkg_resources import resource_filename
 import pytest
 
 from cmlreaders import CMLReader, exc, get_data_index
+from cmlreaders.cmlreader import _cached_index
+from cmlreaders.data_index import _index_dict_to_dataframe, read_index
 from cmlreaders.path_finder import PathFinder
-from cmlreaders.test.utils import patched_cmlreader
-
-datafile = functools.partial(resource_filename, 'cmlreaders.test.data')
+from cmlreaders.test.utils import datafile, patched_cmlreader
 
 
 class TestCMLReader:
     @pytest.mark.parametrize("protocol", ["all", "r1"])
     def test_get_data_index(self, protocol):
         if protocol == "all":
-            path = resource_filename("cmlreaders.test.data", "r1.json")
+            path = datafile("r1.json")
         else:
-            path = resource_filename("cmlreaders.test.data",
-                                     protocol + ".json")
+            path = datafile(protocol + ".json")
 
         with patch.object(PathFinder, "find", return_value=path):
             ix = CMLReader.get_data_index(protocol)
@@ -132,6 +129,13 @@ class TestCMLReader:
             reader_obj = reader.get_reader(file_type)
             assert type(reader_obj) == reader.readers[file_type]
 
+    def test_path_finder(self):
+        with patched_cmlreader():
+            reader = CMLReader("R1278E", "catFR1", 0)
+            finder = reader.path_finder
+            assert finder.montage == "1"
+            assert reader.path_finder is finder
+
     def test_load_unimplemented(self):
         with patched_cmlreader():
             reader = CMLReader(subject='R1405E', localization=0,
@@ -209,8 +213,8 @@ class TestLoadMontage:
         self.assert_categories_correct(df, categories, read_categories)
 
 
-@pytest.mark.rhino
 class TestLoadAggregate:
+    @pytest.mark.rhino
     @pytest.mark.parametrize("subjects,experiments,unique_sessions", [
         (None, None, None),
         ("R1111M", "FR1", 4),
@@ -232,3 +236,52 @@ class TestLoadAggregate:
                                        rootdir=rhino_root)
         size = len(events.groupby(["subject", "experiment", "session"]).size())
         assert size == unique_sessions
+
+    @pytest.mark.parametrize("subjects,experiments,unique_sessions", [
+        ("R1001P", "FR1", 2),
+        (["R1001P", "R1002P"], ["FR2"], 5),
+        (["R1002P", "R1001P"], ["FR2"], 5),
+        (["R1001P"], None, 9),
+        (None, ["YC2"], None),
+    ])
+    def test_load_events_sessions(self, subjects, experiments,
+                                  unique_sessions):
+        """Checks which sessions get loaded without actually loading events."""
+        raw = read_index(datafile("r1.json"))
+        index = _index_dict_to_dataframe(raw)
+
+        def load(self, data_type, **kwargs):
+            return pd.DataFrame({
+                "subject": [self.subject],
+                "experiment": [self.experiment],
+                "session": [self.session],
+                "montage": [self._montage],
+            })
+
+        _cached_index.cache_clear()
+
+        with ExitStack() as stack:
+            stack.callback(_cached_index.cache_clear)
+            stack.enter_context(patch("cmlreaders.cmlreader.get_data_index",
+                                      return_value=index))
+            stack.enter_context(patch.object(CMLReader, "load", load))
+            # make sure events get combined in more than one batch
+            stack.enter_context(
+                patch("cmlreaders.cmlreader._EVENTS_BATCH_SIZE", 2))
+            events = CMLReader.load_events(subjects, experiments)
+
+        if unique_sessions is None:
+            mask = index["experiment"] == experiments[0]
+            unique_sessions = len(index[mask])
+
+        assert len(events) == unique_sessions
+        assert not events.duplicated().any()
+        assert events["montage"].notnull().all()
+
+        # sessions come back in the order subjects were given and sorted
+        # within each subject and experiment
+        if isinstance(subjects, list):
+            loaded = list(dict.fromkeys(events["subject"]))
+            assert loaded == [s for s in subjects if s in loaded]
+        for _, group in events.groupby(["subject", "experiment"]):
+            assert group["session"].is_monotonic_increasing
@@ -1,6 +1,5 @@
 from numpy.testing import assert_equal
 import pandas as pd
-from pkg_resources import resource_filename
 import pytest
 
 from cmlreaders.convert import (
@@ -10,11 +9,12 @@ from cmlreaders.convert import (
     samples_to_milliseconds,
 )
 from cmlreaders.readers.readers import EventReader
+from cmlreaders.test.utils import datafile
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def events():
-    path = resource_filename('cmlreaders.test.data', 'all_events.json')
+    path = datafile('all_events.json')
     return EventReader.fromfile(path, subject="R1389J")
 
 
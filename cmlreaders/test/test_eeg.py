@@ -4,7 +4,6 @@ from pathlib import Path
 import tempfile
 from unittest.mock import patch
 
-from pkg_resources import resource_filename
 import pytest
 
 import h5py
@@ -14,13 +13,14 @@ import pandas as pd
 
 from cmlreaders import CMLReader, PathFinder
 from cmlreaders import convert, exc
+from cmlreaders.readers import eeg
 from cmlreaders.readers.eeg import (
     BaseEEGReader, EEGMetaReader, EEGReader, NumpyEEGReader,
     RamulatorHDF5Reader, SplitEEGReader,
 )
 from cmlreaders.readers.electrodes import MontageReader
 from cmlreaders.readers.readers import EventReader
-from cmlreaders.test.utils import patched_cmlreader
+from cmlreaders.test.utils import datafile, patched_cmlreader
 from cmlreaders.warnings import MissingChannelsWarning
 
 
@@ -29,15 +29,32 @@ class DummyReader(BaseEEGReader):
         return
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def events():
     with patched_cmlreader():
         cml_reader = CMLReader("R1389J")
-        path = resource_filename('cmlreaders.test.data', 'all_events.json')
+        path = datafile('all_events.json')
         reader = cml_reader.get_reader('events', file_path=path)
         return reader.as_dataframe()
 
 
+@pytest.fixture(params=["numpy", "numba"])
+def kernel(request):
+    """Run a test both with the default NumPy code paths and with the numba
+    kernels forced on for all input sizes.
+
+    """
+    if request.param == "numpy":
+        yield request.param
+        return
+
+    pytest.importorskip("numba")
+    assert eeg._numba_kernels() is not None
+
+    with patch.object(eeg, "_NUMBA_MIN_SIZE", 0):
+        yield request.param
+
+
 class TestEEGMetaReader:
     @pytest.mark.parametrize(
         "subject,filename,data_format,n_samples,sample_rate",
@@ -49,7 +66,7 @@ class TestEEGMetaReader:
     )
     def test_load(self, subject, filename, data_format, n_samples,
                   sample_rate):
-        path = resource_filename("cmlreaders.test.data", filename)
+        path = datafile(filename)
         sources = EEGMetaReader.fromfile(path, subject=subject)
 
         assert isinstance(sources, dict)
@@ -79,15 +96,27 @@ class TestBaseEEGReader:
             assert len(reader._unique_contacts) == 10
 
         for i in range(1, 20):
-            if i <= 10 or not use_scheme:
-                assert reader.include_contact(i)
-            else:
-                assert not reader.include_contact(i)
+            included = i <= 10 or not use_scheme
+            assert reader.include_contact(i) == included
+            assert BaseEEGReader.include_contact(reader, i) == included
+
+    def test_rereference_pairs(self, kernel):
+        scheme = pd.DataFrame({
+            "contact_1": [1, 2, 4],
+            "contact_2": [2, 3, 1],
+            "label": ["1-2", "2-3", "4-1"],
+        })
+        reader = self.make_reader(scheme)
+        data = np.random.randint(-1000, 1000, (5, 4, 100)).astype(np.int16)
+        reref, labels = reader.rereference(data, [1, 2, 3, 4])
+
+        assert labels == ["1-2", "2-3", "4-1"]
+        assert reref.dtype == data.dtype
+        assert_equal(reref, data[:, [0, 1, 3], :] - data[:, [1, 2, 0], :])
 
     @pytest.mark.parametrize("filename,expected", [
-        (resource_filename("cmlreaders.test.data", "contacts.json"),
-         "contacts"),
-        (resource_filename("cmlreaders.test.data", "pairs.json"), "pairs"),
+        (datafile("contacts.json"), "contacts"),
+        (datafile("pairs.json"), "pairs"),
         ("", None)
     ])
     def test_scheme_type(self, filename, expected):
@@ -126,7 +155,7 @@ class TestFileReaders:
         return basename, sample_rate, dtype, filename
 
     def test_npy_reader(self):
-        filename = resource_filename("cmlreaders.test.data", "eeg.npy")
+        filename = datafile("eeg.npy")
         reader = NumpyEEGReader(filename, np.int16, [(0, -1)], None, False)
         ts, contacts = reader.read()
         assert ts.shape == (1, 32, 1000)
@@ -134,6 +163,21 @@ class TestFileReaders:
         orig = np.load(filename)
         assert_equal(orig, ts[0])
 
+    def test_split_eeg_reader_local(self, kernel, tmpdir):
+        data = np.random.randint(-1000, 1000, (4, 1000)).astype(np.int16)
+        for channel in range(data.shape[0]):
+            data[channel].tofile(str(tmpdir.join("split.{:03d}".format(
+                channel + 1))))
+
+        epochs = [(100, 200), (0, 100), (850, 950)]
+        reader = SplitEEGReader(str(tmpdir.join("split")), np.int16,
+                                epochs, None, False)
+        ts, contacts = reader.read()
+
+        assert contacts == [1, 2, 3, 4]
+        assert_equal(ts, np.array([data[:, start:stop]
+                                   for start, stop in epochs]))
+
     @pytest.mark.rhino
     def test_split_eeg_reader(self, rhino_root):
         basename, sample_rate, dtype, filename = self.get_meta('R1111M', 'FR1',
@@ -196,7 +240,7 @@ class TestFileReaders:
         assert ts.shape == (len(epochs), num_channels, time_steps)
 
     def test_ramulator_hdf5_reader(self):
-        filename = resource_filename('cmlreaders.test.data', 'eeg.h5')
+        filename = datafile('eeg.h5')
         reader = RamulatorHDF5Reader(filename, np.int16, [(0, None)], None,
                                      False)
         ts, channels = reader.read()
@@ -204,13 +248,55 @@ class TestFileReaders:
         time_steps = 3000
         assert ts.shape == (1, len(channels), time_steps)
 
+    @pytest.mark.parametrize("row_major", [True, False])
+    @pytest.mark.parametrize("cache_nbytes", [None, 202 * 2 * 256])
+    @pytest.mark.parametrize("libver", ["earliest", "latest"])
+    @pytest.mark.parametrize("chunk_len", [100, 1000])
+    def test_ramulator_hdf5_reader_chunked(self, row_major, cache_nbytes,
+                                           libver, chunk_len, tmpdir):
+        src = datafile('eeg.h5')
+        filename = str(tmpdir.join("chunked.h5"))
+
+        with h5py.File(src, 'r') as infile:
+            raw = infile['timeseries'][:]
+            with h5py.File(filename, 'w', libver=libver) as outfile:
+                for key in ['ports', 'monopolar_possible']:
+                    infile.copy(key, outfile)
+                ts = raw if row_major else raw.T
+                chunks = (chunk_len, ts.shape[1]) if row_major else \
+                    (ts.shape[0], chunk_len)
+                dset = outfile.create_dataset('timeseries', data=ts,
+                                              chunks=chunks)
+                dset.attrs['orient'] = b'row' if row_major else b'col'
+
+        epochs = [(2900, 3000), (0, 100), (50, 150), (120, 220), (1000, 1100)]
+
+        with patch.object(eeg, "_H5_CHUNK_CACHE_NBYTES",
+                          cache_nbytes or eeg._H5_CHUNK_CACHE_NBYTES):
+            reader = RamulatorHDF5Reader(filename, np.int16, epochs, None,
+                                         False)
+            data, _ = reader.read()
+
+        expected = np.array([raw[start:stop].T for start, stop in epochs])
+        assert_equal(data, expected)
+
+    def test_ramulator_hdf5_aligned_blocks(self):
+        windows = [slice(0, 100), slice(50, 150), slice(2900, 3000)]
+
+        # short chunks: overlapping epochs share one chunk-aligned block
+        blocks = RamulatorHDF5Reader._aligned_blocks(windows, 100, 3000, 256)
+        assert blocks == [(slice(0, 200), [0, 1]), (slice(2900, 3000), [2])]
+
+        # long chunks: epochs are read as exact windows
+        blocks = RamulatorHDF5Reader._aligned_blocks(windows, 1000, 3000, 256)
+        assert blocks == [(window, [i]) for i, window in enumerate(windows)]
+
     def test_ramulator_hdf5_rereference(self):
-        pairs_file = resource_filename("cmlreaders.test.data",
-                                       "R1405E_pairs_loc1_mon1.json")
+        pairs_file = datafile("R1405E_pairs_loc1_mon1.json")
         pairs = MontageReader("pairs", subject="R1405E",
                               file_path=pairs_file,).load()
 
-        filename = resource_filename("cmlreaders.test.data", "eeg.h5")
+        filename = datafile("eeg.h5")
 
         make_reader = partial(RamulatorHDF5Reader, filename, np.int16,
                               [(0, None)])
@@ -384,10 +470,12 @@ class TestEEGReader:
         ]),
     ])
     def test_eeg_absolute(self, subject, events_filename, expected_basenames):
-        path = resource_filename("cmlreaders.test.data", events_filename)
+        path = datafile(events_filename)
         events = EventReader.fromfile(path)
+        orig_events = events.copy()
         reader = EEGReader("eeg", subject)
         new_events = reader._eegfile_absolute(events)
+        pd.testing.assert_frame_equal(events, orig_events)
 
         for eegfile in new_events[
                 new_events["eegfile"].notnull()]["eegfile"].unique():
@@ -467,10 +555,11 @@ class TestRereference:
         prefix = "split"
         eeg_dir = self.prepare_dirs(prefix)
 
-        for channel in range(self.data.shape[0]):
+        data = np.ascontiguousarray(self.data)
+        for channel in range(data.shape[0]):
             filepath = eeg_dir.joinpath(prefix + ".{:03d}".format(channel + 1))
-            with filepath.open("w") as eegfile:
-                self.data[channel].tofile(eegfile.name)
+            with filepath.open("wb") as eegfile:
+                data[channel].tofile(eegfile)
 
         return eeg_dir.joinpath(prefix)
 
@@ -480,7 +569,7 @@ class TestRereference:
         eeg_dir = self.prepare_dirs(name)
         eeg_path = eeg_dir.joinpath(name)
 
-        with h5py.File(eeg_dir.joinpath(name), "w") as hfile:
+        with h5py.File(eeg_dir.joinpath(name), "w", libver="latest") as hfile:
             if not rerefable:
                 # these names are *all* incorrect, but that's the format we
                 # have, so we have no choice but to go with it...
@@ -511,7 +600,16 @@ class TestRereference:
                 data = self.data.transpose()
 
             hfile["ports"] = [i + 1 for i in range(3)]
-            ts = hfile.create_dataset("timeseries", data=data)
+
+            # chunk along the time axis in blocks of ~1 MB
+            n_samples, n_channels = data.shape
+            samples_per_chunk = max(
+                1, 1024 ** 2 // (n_channels * data.dtype.itemsize)
+            )
+            ts = hfile.create_dataset(
+                "timeseries", data=data,
+                chunks=(min(samples_per_chunk, n_samples), n_channels),
+            )
             ts.attrs["orient"] = b"row"
 
         return eeg_path
@@ -545,8 +643,7 @@ class TestRereference:
 
 class TestLoadEEG:
     def test_load_with_empty_events(self):
-        sources_file = resource_filename("cmlreaders.test.data",
-                                         "sources.json")
+        sources_file = datafile("sources.json")
         with patch.object(PathFinder, "find", return_value=sources_file):
             reader = EEGReader("eeg")
 
@@ -556,6 +653,23 @@ class TestLoadEEG:
                                   return_value=[data, None]):
                     reader.load()
 
+    @pytest.mark.parametrize("subject,session,match", [
+        ("R1111M", 1, r"initialized: 0 \(events correspond to 1\)"),
+        ("R1001P", 0, r"initialized: R1111M \(events correspond to R1001P\)"),
+        (["R1111M", "R1001P"], 0, "one subject only"),
+        ("R1111M", [0, 1], "one session only"),
+    ])
+    def test_load_with_mismatched_events(self, subject, session, match):
+        events = pd.DataFrame({
+            "subject": subject,
+            "session": session,
+            "eegoffset": [0, 1],
+        }, index=[10, 11])
+        reader = CMLReader("R1111M", "FR1", 0)
+
+        with pytest.raises(ValueError, match=match):
+            reader.load_eeg(events, rel_start=0, rel_stop=10)
+
     @pytest.mark.rhino
     @pytest.mark.parametrize("subjects,experiments", [
         (["R1111M"], ["FR1"]),
@@ -1,14 +1,16 @@
+from copy import deepcopy
+import pickle
 import sys
 
 import numpy as np
 from numpy.testing import assert_equal
 import pandas as pd
-from pkg_resources import resource_filename
 import pytest
 
 from ptsa.data.timeseries import TimeSeries
 
 from cmlreaders.eeg_container import EEGContainer
+from cmlreaders.test.utils import datafile
 
 
 class TestEEGContainer:
@@ -27,6 +29,26 @@ class TestEEGContainer:
         assert len(ts.time) == ts.data.shape[-1]
         assert_equal(ts.time[1] - ts.time[0], 1000. / samplerate)
 
+    def test_time_lazy(self):
+        series = [
+            EEGContainer(np.random.random((1, 4, 10)), 1000, tstart=10 * i)
+            for i in range(2)
+        ]
+        ts = EEGContainer.concatenate(series, dim="time")
+
+        assert all(s._time is None for s in series + [ts])
+        assert ts.tstart == 0
+        assert_equal(ts.time, np.arange(20))
+
+    @pytest.mark.parametrize("samplerate", [256, 333, 499.7, 1024])
+    @pytest.mark.parametrize("tstart", [-200, 13.7])
+    def test_make_time_array_length(self, samplerate, tstart):
+        for n_samples in range(1, 1000, 7):
+            data = np.empty((1, 1, n_samples))
+            ts = EEGContainer(data, samplerate=samplerate, tstart=tstart)
+            assert len(ts.time) == n_samples
+            assert ts.time[0] == tstart
+
     @pytest.mark.parametrize("data", [
         np.random.random((1, 32, 100)),
         np.random.random((32, 100)),
@@ -61,6 +83,17 @@ class TestEEGContainer:
         with pytest.raises(ValueError):
             EEGContainer(data, 1000, epochs=bad_epochs)
 
+    def test_start_offsets(self):
+        data = np.random.random((3, 2, 10))
+        ts = EEGContainer(data, 1000, epochs=[(0, 10), (5, 15), (20, 30)])
+
+        offsets = ts.start_offsets
+        assert_equal(offsets, [0, 5, 20])
+        offsets += 1
+
+        ts.epochs[1] = (99, 109)
+        assert_equal(ts.start_offsets, [0, 99, 20])
+
     def test_create_channels(self):
         data = np.random.random((11, 32, 100))
         contacts = [i + 1 for i in range(data.shape[1])]
@@ -111,6 +144,37 @@ class TestEEGContainer:
             assert ts.shape == (1, n_channels, n_samples * 2)
             assert_equal(ts.data, np.concatenate(data, axis=2))
 
+        assert ts.attrs == {"test": ["me", "me"]}
+
+        # attrs must survive copying loaded EEG
+        for copied in (deepcopy(ts), pickle.loads(pickle.dumps(ts))):
+            assert copied.attrs == {"test": ["me", "me"]}
+
+    def test_concatenate_time_many(self):
+        rate = 500
+        n_samples = 50
+        series = [
+            EEGContainer(np.random.random((1, 4, n_samples)), rate,
+                         tstart=i * n_samples * 1000. / rate)
+            for i in range(3)
+        ]
+
+        ts = EEGContainer.concatenate(series, dim="time")
+        assert ts.shape == (1, 4, 3 * n_samples)
+        assert_equal(ts.data, np.concatenate([s.data for s in series], axis=2))
+
+        series[2] = EEGContainer(series[2].data, rate, tstart=0)
+        with pytest.raises(ValueError):
+            EEGContainer.concatenate(series, dim="time")
+
+    def test_concatenate_mismatched_epochs(self):
+        rate = 1000
+        first = EEGContainer(np.random.random((1, 4, 10)), rate)
+        second = EEGContainer(np.random.random((2, 4, 10)), rate, tstart=10)
+
+        with pytest.raises(ValueError):
+            EEGContainer.concatenate([first, second], dim="time")
+
     @pytest.mark.skipif(sys.version_info < (3, 6),
                         reason="No PTSA 2 package for Python 3.5")
     @pytest.mark.parametrize("which", ["events", "epochs"])
@@ -122,8 +186,7 @@ class TestEEGContainer:
             epochs = [(i, i + 100) for i in range(data.shape[0])]
             ts = EEGContainer(data, rate, epochs=epochs)
         else:
-            filename = resource_filename("cmlreaders.test.data",
-                                         "R1111M_FR1_0_events.json")
+            filename = datafile("R1111M_FR1_0_events.json")
             events = pd.read_json(filename).iloc[:data.shape[0]]
             ts = EEGContainer(data, rate, events=events)
 
@@ -34,6 +34,21 @@ class TestMontageReader:
             assert 'contact_1' in df.columns
             assert 'contact_2' in df.columns
 
+    def test_load_json_cached(self):
+        path = datafile("R1405E_pairs.json")
+
+        def load():
+            return MontageReader("pairs", subject="R1405E",
+                                 file_path=path).load()
+
+        first = load()
+        first["label"] = "mutated"
+        first.loc[0, "contact_1"] = -1
+
+        second = load()
+        assert (second["label"] != "mutated").all()
+        assert second.loc[0, "contact_1"] != -1
+
     @pytest.mark.parametrize("kind,subject,montage", [
         ("matlab_contacts", "R1001P", 0),
         ("matlab_pairs", "R1001P", 0),
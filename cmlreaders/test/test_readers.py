@@ -1,10 +1,8 @@
-import functools
 from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
 import pytest
-from pkg_resources import resource_filename
 
 from cmlreaders.exc import UnsupportedRepresentation,\
     UnsupportedExperimentError
@@ -24,8 +22,7 @@ from cmlreaders.readers.reports import (
     BaseRAMReportDataReader,
     RAMReportSummaryDataReader
 )
-
-datafile = functools.partial(resource_filename, 'cmlreaders.test.data')
+from cmlreaders.test.utils import datafile
 
 
 class TestTextReader:
@@ -62,13 +59,10 @@ class TestTextReader:
         assert "number" in js.columns
         assert "label" in js.columns
 
-        data = np.loadtxt(filename, delimiter=sep, dtype=[
-            ("number", "<i8"),
-            ("label", "|U32"),
-        ])
+        data = pd.read_csv(filename, sep=sep, names=["number", "label"])
 
-        np.testing.assert_equal(data["number"], js.number)
-        np.testing.assert_equal(data["label"], js.label)
+        np.testing.assert_equal(data["number"].values, js.number.values)
+        np.testing.assert_equal(data["label"].values, js.label.values)
 
     def test_failures(self):
         """
@@ -1,12 +1,13 @@
 from contextlib import contextmanager
 import os
 from random import shuffle
+from unittest.mock import patch
 
 import pytest
 
-from cmlreaders import exc
+from cmlreaders import exc, util
 from cmlreaders.util import DefaultTuple, get_protocol, get_root_dir,\
-    is_rerefable
+    is_rerefable, load_json
 
 
 @contextmanager
@@ -84,3 +85,20 @@ class TestDefaultTuple:
         # use a custom default
         dtuple = DefaultTuple(invals, default="hi")
         assert dtuple[index] == "hi"
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+@pytest.mark.parametrize("text,expected", [
+    ('{"a": [1, 2.5, "x"], "b": null}', {"a": [1, 2.5, "x"], "b": None}),
+    ('{"big": 18446744073709551616}', {"big": 2 ** 64}),
+])
+def test_load_json(use_orjson, text, expected, tmpdir):
+    if use_orjson and util.orjson is None:
+        pytest.skip("orjson not installed")
+
+    path = str(tmpdir.join("test.json"))
+    with open(path, "w") as f:
+        f.write(text)
+
+    with patch.object(util, "orjson", util.orjson if use_orjson else None):
+        assert load_json(path) == expected
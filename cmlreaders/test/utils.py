@@ -3,11 +3,16 @@ from pathlib import Path
 from typing import Optional, Union
 from unittest.mock import patch
 
-from pkg_resources import resource_filename
-
 from cmlreaders import CMLReader, PathFinder
 from cmlreaders.data_index import _index_dict_to_dataframe, read_index
 
+_DATA_DIR = Path(__file__).parent.joinpath("data")
+
+
+def datafile(name: str) -> str:
+    """Get the full path to a file in the test data directory."""
+    return str(_DATA_DIR.joinpath(name))
+
 
 @contextmanager
 def patched_cmlreader(file_path: Optional[Union[str, Path]] = None):
@@ -18,7 +23,7 @@ def patched_cmlreader(file_path: Optional[Union[str, Path]] = None):
     file_path
 
     """
-    raw = read_index(resource_filename("cmlreaders.test.data", "r1.json"))
+    raw = read_index(datafile("r1.json"))
 
     with patch.object(CMLReader, "_load_index",
                       return_value=_index_dict_to_dataframe(raw)):
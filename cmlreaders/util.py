@@ -1,3 +1,5 @@
+from functools import lru_cache
+import json
 import os
 from pathlib import Path
 from typing import Any, Iterable, Optional, Union
@@ -5,6 +7,11 @@ from typing import Any, Iterable, Optional, Union
 from cmlreaders import constants
 from cmlreaders.exc import UnknownProtocolError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 def get_root_dir(path: Union[str, Path] = None) -> str:
     """Used to set a default root directory. The root directory is resolved in
@@ -21,6 +28,26 @@ def get_root_dir(path: Union[str, Path] = None) -> str:
     return os.path.expanduser(os.environ.get("CML_ROOT", "/"))
 
 
+def load_json(path: Union[str, Path]) -> Any:
+    """Parse a JSON file, using :mod:`orjson` when it is installed.
+
+    Documents that orjson rejects but the standard library accepts (e.g.,
+    ones containing ``NaN`` or integers wider than 64 bits) are parsed with
+    :mod:`json` instead.
+
+    """
+    with open(path, "rb") as f:
+        raw = f.read()
+
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(raw.decode())
+
+
 def is_rerefable(subject: str, experiment: str, session: int,
                  localization: int = 0, montage: int = 0,
                  rootdir: Optional[str] = None) -> bool:
@@ -62,6 +89,7 @@ def is_rerefable(subject: str, experiment: str, session: int,
     return True
 
 
+@lru_cache(maxsize=None)
 def get_protocol(subject: str) -> str:
     """Get the protocol name from the subject code.
 
@@ -12,6 +12,10 @@ with open('CHANGELOG.rst') as history_file:
 
 requirements = []
 setup_requirements = []
+extras_requirements = {
+    # faster rereferencing and epoch copies for large EEG reads
+    "numba": ["numba"],
+}
 
 setup(
     name='cmlreaders',
@@ -23,6 +27,7 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requirements,
+    extras_require=extras_requirements,
     zip_safe=False,
     keywords='cmlreaders',
     setup_requires=setup_requirements,